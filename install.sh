@@ -39,7 +39,7 @@ sudo chown $CURRENT_USER:$CURRENT_GROUP "$APP_DIR"/*
 echo "🐍 Installing Python dependencies..."
 if [[ "$OSTYPE" == "linux-gnu"* ]]; then
     sudo apt-get update
-    sudo apt-get install -y python3-pip python3-pygame python3-requests python3-geopy python3-venv python3-full
+    sudo apt-get install -y python3-pip python3-pygame python3-requests python3-venv python3-full
     
     # Create virtual environment for Python packages
     echo "🔧 Creating virtual environment..."
@@ -7,21 +7,66 @@ Displays real-time subway arrival times in MTA-style signage
 import os
 import sys
 import time
-import json
-import requests
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import heapq
+import queue
+import threading
+import urllib3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict
 import pygame
+import pygame.gfxdraw
 from dotenv import load_dotenv
-from geopy.distance import geodesic
 import logging
+from collections import OrderedDict
+
+# Ask for the native upb protobuf parser before google.protobuf is imported
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
 
 try:
-    from google.transit import gtfs_realtime_pb2
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+    from google.protobuf.internal import api_implementation
     PROTOBUF_AVAILABLE = True
 except ImportError:
     PROTOBUF_AVAILABLE = False
-    logging.warning("GTFS protobuf bindings not available. Install with: pip install gtfs-realtime-bindings")
+    logging.warning("Protobuf not available. Install with: pip install protobuf")
+
+def _build_feed_message_class():
+    """Build a GTFS-realtime FeedMessage class that declares only the fields we read
+    
+    Field numbers match gtfs-realtime.proto. Everything else on the wire (feed
+    header, vehicle positions, alerts, NYCT extensions) is skipped as unknown
+    fields instead of being decoded into message objects.
+    """
+    field = descriptor_pb2.FieldDescriptorProto
+    proto = descriptor_pb2.FileDescriptorProto(name='mta_display/gtfs_realtime_slim.proto',
+                                               package='mta_display.slim', syntax='proto2')
+    messages = {
+        'FeedMessage': [('entity', 2, field.LABEL_REPEATED, 'FeedEntity')],
+        'FeedEntity': [('trip_update', 3, field.LABEL_OPTIONAL, 'TripUpdate')],
+        'TripUpdate': [('trip', 1, field.LABEL_OPTIONAL, 'TripDescriptor'),
+                       ('stop_time_update', 2, field.LABEL_REPEATED, 'StopTimeUpdate')],
+        'TripDescriptor': [('route_id', 5, field.LABEL_OPTIONAL, field.TYPE_STRING)],
+        'StopTimeUpdate': [('arrival', 2, field.LABEL_OPTIONAL, 'StopTimeEvent'),
+                           ('stop_id', 4, field.LABEL_OPTIONAL, field.TYPE_STRING)],
+        'StopTimeEvent': [('time', 2, field.LABEL_OPTIONAL, field.TYPE_INT64)],
+    }
+    for message_name, fields in messages.items():
+        message = proto.message_type.add(name=message_name)
+        for name, number, label, field_type in fields:
+            if isinstance(field_type, str):
+                message.field.add(name=name, number=number, label=label, type=field.TYPE_MESSAGE,
+                                  type_name=f'.mta_display.slim.{field_type}')
+            else:
+                message.field.add(name=name, number=number, label=label, type=field_type)
+    
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(proto)
+    descriptor = pool.FindMessageTypeByName('mta_display.slim.FeedMessage')
+    if hasattr(message_factory, 'GetMessageClass'):
+        return message_factory.GetMessageClass(descriptor)
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+FeedMessage = _build_feed_message_class() if PROTOBUF_AVAILABLE else None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -30,6 +75,50 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Fallback destination per route - MTA real-time feeds don't include trip headsigns
+FALLBACK_DESTINATIONS = {
+    '1': '242 St', '2': 'Flatbush Av', '3': 'Jamaica Center', '4': 'Woodlawn', 
+    '5': '242 St', '6': 'Pelham Bay Park', '7': 'Flushing-Main St',
+    'A': 'Inwood-207 St', 'C': 'Euclid Av', 'E': 'Jamaica Center',
+    'B': 'Brighton Beach', 'D': 'Coney Island', 'F': 'Jamaica-179 St', 'M': 'Middle Village',
+    'G': 'Church Av', 'J': 'Jamaica Center', 'Z': 'Jamaica Center', 'L': 'Canarsie-Rockaway Pkwy',
+    'N': 'Coney Island', 'Q': 'Coney Island', 'R': 'Bay Ridge-95 St', 'W': 'Astoria-Ditmars Blvd',
+    'S': 'Times Sq-42 St'
+}
+
+# Secondary detail line per route
+ROUTE_DETAILS = {
+    '1': '242 St', '2': 'Flatbush Av', '3': 'Jamaica Center', '4': 'Woodlawn', '5': '242 St', '6': 'Pelham Bay Park',
+    'A': 'Inwood-207 St', 'C': 'Euclid Av', 'E': 'Jamaica Center',
+    'B': 'Brighton Beach', 'D': 'Coney Island', 'F': 'Jamaica-179 St', 'M': 'Middle Village',
+    'G': 'Church Av', 'J': 'Jamaica Center', 'Z': 'Jamaica Center', 'L': 'Canarsie-Rockaway Pkwy',
+    'N': 'Coney Island', 'Q': 'Coney Island', 'R': 'Bay Ridge-95 St', 'W': 'Astoria-Ditmars Blvd',
+    'S': 'Times Sq-42 St'
+}
+
+# Countdown labels, built once: "0s".."59s" and "0m".."59m" (feeds only
+# look 30 minutes ahead; anything further is formatted on demand)
+SECOND_LABELS = tuple(f"{n}s" for n in range(60))
+MINUTE_LABELS = tuple(f"{n}m" for n in range(60))
+
+class Arrival:
+    """One upcoming train at a station"""
+    
+    # Fixed attribute slots - cheaper to build and read than a dict per arrival
+    __slots__ = ('route_id', 'station_id', 'arrival_time', 'destination', 'detail', 'status', '_fmt')
+    
+    def __init__(self, route_id: str, station_id: str, arrival_time: float,
+                 destination: str, detail: str = '', status: str = 'On Time'):
+        self.route_id = route_id
+        self.station_id = station_id
+        # Seconds on the time.monotonic() clock, so countdowns ignore wall-clock steps
+        self.arrival_time = arrival_time
+        self.destination = destination
+        self.detail = detail
+        self.status = status
+        # (second, text) memo for the countdown label
+        self._fmt = None
+
 class MTADisplay:
     def __init__(self):
         """Initialize the MTA Display application"""
@@ -45,6 +134,15 @@ class MTADisplay:
         self.station_name = os.getenv('STATION_NAME', 'Atlantic Av-Barclays Ctr')
         self.refresh_interval = int(os.getenv('REFRESH_INTERVAL', '30'))
         self.fullscreen = os.getenv('FULLSCREEN', 'true').lower() == 'true'
+        # Skip a refresh while the next train is further out than this (seconds)...
+        self.refresh_lead_time = 120
+        # ...unless the data is older than this (seconds)
+        self.max_data_age = 300
+        
+        # The pure-Python protobuf runtime is far too slow to parse 8 feeds on a Pi
+        if PROTOBUF_AVAILABLE and api_implementation.Type() == 'python':
+            raise RuntimeError("Pure-Python protobuf runtime loaded. Install protobuf>=4.21 for the native parser "
+                               "(or set PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb)")
         
         # MTA API endpoints - Free public feeds (no API key required)
         self.feed_urls = {
@@ -58,10 +156,19 @@ class MTADisplay:
             'SIR': "https://api-endpoint.mta.info/Dataservice/mtagtfsfeeds/nyct%2Fgtfs-si"
         }
         
-        # Initialize Pygame
-        pygame.init()
-        self.setup_display()
-        self.setup_fonts()
+        # Every feed lives on one host, so a single keep-alive pool sized to the
+        # worker count covers them all; the refresh loop does its own retrying
+        self._http = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=len(self.feed_urls),
+            timeout=urllib3.Timeout(connect=3, read=10),
+            retries=False,
+        )
+        self._base_headers = urllib3.make_headers(accept_encoding=True)
+        if self.api_key:
+            self._base_headers['x-api-key'] = self.api_key
+        # Worker per feed, reused across refreshes
+        self._executor = ThreadPoolExecutor(max_workers=len(self.feed_urls))
         
         # MTA color scheme - matching the real display
         self.colors = {
@@ -71,6 +178,7 @@ class MTADisplay:
             'text_white': (255, 255, 255),    # White text
             'frame': (0, 0, 0),               # Black frame
             'status_light': (0, 255, 0),      # Green status light
+            'row_background': (5, 15, 35),    # Very subtle background behind each arrival
             # Route colors - matching MTA official colors
             'route_1': (238, 42, 36),         # Red
             'route_2': (0, 57, 166),          # Blue
@@ -96,6 +204,61 @@ class MTADisplay:
             'route_W': (255, 255, 0),         # Yellow
             'route_Z': (153, 102, 51),        # Brown
         }
+        # Route colors keyed by bare route ID, for lookups on the draw path
+        self._route_colors = {key[len('route_'):]: color for key, color in self.colors.items()
+                              if key.startswith('route_')}
+        
+        # Stop ID (with direction suffixes) -> routes that serve it, for _parse_candidates.
+        # Atlantic Ave has multiple station IDs: A42, A42S, A42N, R30, R30S, R30N
+        self._stop_route_map: Dict[str, set] = {}
+        for station_id in self.station_ids:
+            if station_id in ['A42', 'A42N', 'A42S']:
+                # IRT platforms (2,3,4,5 lines)
+                serving_routes = {'2', '3', '4', '5'}
+            elif station_id in ['R30', 'R30N', 'R30S']:
+                # BMT platforms (B,D,N,Q,R lines)
+                serving_routes = {'B', 'D', 'N', 'Q', 'R'}
+            else:
+                # For other stations, we'd need to map them individually
+                logger.warning(f"Unknown station ID: {station_id}")
+                continue
+            stop_ids = [station_id]
+            if not station_id.endswith(('N', 'S')):
+                stop_ids += [station_id + 'N', station_id + 'S']
+            for stop_id in stop_ids:
+                self._stop_route_map.setdefault(stop_id, set()).update(serving_routes)
+        
+        # Parsed FeedMessage per feed, reused across refreshes
+        self._feed_messages = {}
+        # HTTP validators and last parsed (arrival_ts, route_id, stop_id)
+        # candidates per feed, for conditional GETs
+        self._etags: Dict[str, str] = {}
+        self._last_modified: Dict[str, str] = {}
+        self._feed_candidates: Dict[str, list] = {}
+        
+        # Rendered text surfaces keyed by (font, text, color), bounded LRU
+        self._text_cache = OrderedDict()
+        self._text_cache_size = 256
+        # Route circles keyed by (route_id, radius): format-independent masters
+        # drawn once, and their display-format copies
+        self._route_masters = {}
+        self._route_sprites = {}
+        
+        # Arrivals handed from the refresh thread to the render loop
+        self.cached_arrivals = []
+        self._arrivals_q = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        
+        # Frame rates for the main loop: after a redraw, and while nothing changes
+        self._active_fps = 10
+        self._idle_fps = 2
+        
+        # Initialize Pygame (fonts first - route sprites need them). Skip the
+        # SDL driver probing if another instance in this process already did it.
+        if not pygame.get_init():
+            pygame.init()
+        self.setup_fonts()
+        self.setup_display()
         
         self.running = True
         
@@ -106,9 +269,71 @@ class MTADisplay:
         else:
             self.screen = pygame.display.set_mode((1200, 800))
         
+        # Everything below converts surfaces to the display format, which
+        # only exists once set_mode has run
         pygame.display.set_caption("NYC MTA Subway Times")
         self.clock = pygame.time.Clock()
+        # New surface - the next frame must be a full redraw
+        self._last_rows = None
+        
+        # Cached surfaces were converted for the previous display format
+        self._text_cache.clear()
+        
+        # Convert a circle sprite for every known route at the row radius;
+        # the circles themselves are only drawn the first time through
+        self._route_sprites.clear()
+        for route_id in self._route_colors:
+            self._route_sprite(route_id, 25)
+        
+        # The destination and detail strings are a small fixed set - render them up front
+        row_background = self.colors['row_background']
+        for destination in set(FALLBACK_DESTINATIONS.values()):
+            self._render(self.destination_font, destination, self.colors['text_primary'], row_background)
+        for detail in set(ROUTE_DETAILS.values()):
+            self._render(self.detail_font, detail, self.colors['text_secondary'], row_background)
         
+        # Widest countdown text, so a changed countdown can be redrawn in place
+        self._time_column_w = max([self.time_font.size(text)[0] for text in ("Now", "59s", "99")] +
+                                  [self.time_unit_font.size("MM")[0]])
+        
+        self._rebuild_static_background()
+        
+    def _rebuild_static_background(self):
+        """Render the parts of the sign that never change into one surface"""
+        width, height = self.screen.get_size()
+        background = pygame.Surface((width, height))
+        
+        # Fill with dark blue background
+        fill = self.colors['background']
+        background.fill(fill)
+        
+        # Draw black frame around the display
+        frame_rect = pygame.Rect(10, 10, width - 20, height - 20)
+        pygame.draw.rect(background, self.colors['frame'], frame_rect, 3)
+        
+        # Draw green status light at top center
+        status_light_rect = pygame.Rect(width // 2 - 5, 15, 10, 10)
+        pygame.draw.rect(background, self.colors['status_light'], status_light_rect)
+        
+        # Draw sign ID in top left (like "468-0-4" in the image)
+        sign_id = "MTA-001"
+        id_surface = self._render(self.detail_font, sign_id, self.colors['text_white'], fill)
+        background.blit(id_surface, (20, 20))
+        
+        # Draw station name below the sign ID
+        station_surface = self._render(self.destination_font, self.station_name, self.colors['text_white'], fill)
+        background.blit(station_surface, (20, 45))
+        
+        self._background = background.convert()
+        
+        # The "no data" screen is just as static, so bake it too
+        no_data = self._background.copy()
+        error_surface = self._render(self.destination_font, "NO DATA AVAILABLE", self.colors['text_white'], fill)
+        no_data.blit(error_surface, error_surface.get_rect(center=(width // 2, height // 2)))
+        error_detail = self._render(self.detail_font, "Check MTA API connection", self.colors['text_secondary'], fill)
+        no_data.blit(error_detail, error_detail.get_rect(center=(width // 2, height // 2 + 40)))
+        self._no_data_background = no_data
+    
     def setup_fonts(self):
         """Load fonts for the display"""
         try:
@@ -128,211 +353,284 @@ class MTADisplay:
             self.time_font = pygame.font.Font(None, 40)
             self.time_unit_font = pygame.font.Font(None, 24)
     
+    def _render(self, font, text: str, color: tuple, background: tuple = None):
+        """Render text through the surface cache
+        
+        Text drawn over a known solid ``background`` is rendered opaque, which
+        blits as a plain copy instead of a per-pixel alpha blend.
+        """
+        key = (id(font), text, color, background)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Match the display pixel format so blits take SDL's fast path
+            if background is None:
+                surface = font.render(text, True, color).convert_alpha()
+            else:
+                surface = font.render(text, True, color, background).convert()
+            self._text_cache[key] = surface
+            if len(self._text_cache) > self._text_cache_size:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return surface
+    
     def get_route_color(self, route_id: str) -> tuple:
         """Get the color for a specific route"""
-        route_key = f"route_{route_id}"
-        return self.colors.get(route_key, self.colors['text_primary'])
+        return self._route_colors.get(route_id, self.colors['text_primary'])
     
-    def fetch_mta_data(self) -> List[Dict]:
-        """Fetch real-time data from MTA API"""
-        all_arrivals = []
-        
-        for feed_name, url in self.feed_urls.items():
-            try:
-                headers = {}
-                if self.api_key:
-                    headers['x-api-key'] = self.api_key
-                response = requests.get(url, headers=headers, timeout=10)
-                response.raise_for_status()
-                
-                logger.info(f"Response status: {response.status_code}, Content-Type: {response.headers.get('content-type', 'unknown')}")
-                
-                # Parse protobuf data
-                arrivals = self.parse_feed_data(response.content, feed_name)
-                all_arrivals.extend(arrivals)
-                
-            except Exception as e:
-                logger.error(f"Error fetching data from {feed_name}: {e}")
-                continue
+    def _fetch_one(self, feed: tuple) -> List[Arrival]:
+        """Fetch and parse a single (feed_name, url) feed"""
+        feed_name, url = feed
+        try:
+            headers = dict(self._base_headers)
+            # Conditional GET - an unchanged feed comes back as an empty 304
+            if feed_name in self._etags:
+                headers['If-None-Match'] = self._etags[feed_name]
+            if feed_name in self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified[feed_name]
+            # The body is read in full and the connection goes back to the pool
+            response = self._http.request('GET', url, headers=headers)
+            if response.status == 304:
+                # Same trains as last time, but re-windowed against the current clock
+                logger.debug("Feed %s not modified, reusing cached candidates", feed_name)
+                return self._select_arrivals(self._feed_candidates.get(feed_name, []))
+            if response.status != 200:
+                logger.error(f"Error fetching data from {feed_name}: HTTP {response.status}")
+                return []
+            
+            # Parse protobuf data
+            candidates = self._parse_candidates(response.data, feed_name)
+            if candidates is None:
+                # Rejected body - keep the previous validators and candidates
+                return []
+            
+            # Remember the validators and candidates for the next conditional GET
+            self._feed_candidates[feed_name] = candidates
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etags[feed_name] = etag
+            last_modified = response.headers.get('Last-Modified')
+            if last_modified:
+                self._last_modified[feed_name] = last_modified
+            return self._select_arrivals(candidates)
+            
+        except Exception as e:
+            logger.error(f"Error fetching data from {feed_name}: {e}")
+            return []
+    
+    def fetch_mta_data(self) -> List[Arrival]:
+        """Fetch real-time data from MTA API, all feeds concurrently"""
+        futures = [self._executor.submit(self._fetch_one, feed) for feed in self.feed_urls.items()]
         
+        all_arrivals = []
+        for future in as_completed(futures):
+            all_arrivals.extend(future.result())
         return all_arrivals
     
-    def parse_feed_data(self, data: bytes, feed_name: str) -> List[Dict]:
-        """Parse real MTA feed data using protobuf"""
+    def _parse_candidates(self, data: bytes, feed_name: str):
+        """Extract (arrival_ts, route_id, stop_id) tuples for our station
+        
+        Returns None when the body can't be used, so callers can tell a
+        rejected response from a feed with no matching trains.
+        """
         if not PROTOBUF_AVAILABLE:
             logger.error("Protobuf not available - cannot parse MTA data")
-            return []
+            return None
 
         try:
-            logger.info(f"Parsing {len(data)} bytes of data from {feed_name}")
+            # Per-poll chatter stays at DEBUG with lazy formatting
+            logger.debug("Parsing %d bytes of data from %s", len(data), feed_name)
             # Check if we got an error response instead of protobuf data
             if len(data) < 1000:  # Likely an error response
                 logger.error(f"Received error response ({len(data)} bytes) from MTA API. Data: {data[:100]}")
-                return []
+                return None
             
-            feed = gtfs_realtime_pb2.FeedMessage()
+            # Reuse one message per feed across refreshes (ParseFromString clears it)
+            feed = self._feed_messages.get(feed_name)
+            if feed is None:
+                feed = self._feed_messages[feed_name] = FeedMessage()
             feed.ParseFromString(data)
             
-            logger.info(f"Feed has {len(feed.entity)} entities")
-            arrivals = []
-            current_time = datetime.now()
-            
-            # Build station mapping dynamically based on configured station IDs
-            target_stations = {}
-            for station_id in self.station_ids:
-                if station_id in ['A42', 'A42N', 'A42S']:
-                    # IRT platforms (2,3,4,5 lines)
-                    target_stations[station_id] = ['2', '3', '4', '5']
-                elif station_id in ['R30', 'R30N', 'R30S']:
-                    # BMT platforms (B,D,N,Q,R lines)
-                    target_stations[station_id] = ['B', 'D', 'N', 'Q', 'R']
-                else:
-                    # For other stations, we'd need to map them individually
-                    logger.warning(f"Unknown station ID: {station_id}")
+            logger.debug("Feed %s has %d entities", feed_name, len(feed.entity))
+            # Bare tuples: the time window is applied at selection time, so
+            # the same candidates stay valid when a 304 hands them back later
+            candidates = []
+            add = candidates.append
             
+            stop_route_map = self._stop_route_map
             for entity in feed.entity:
-                if entity.HasField('trip_update'):
-                    trip_update = entity.trip_update
-                    
-                    # Get route ID
-                    route_id = trip_update.trip.route_id
+                # Plain field reads instead of HasField: an absent trip_update
+                # reads as an empty route ID, an absent arrival as time 0
+                trip_update = entity.trip_update
+                route_id = trip_update.trip.route_id
+                if not route_id:
+                    continue
+                
+                # Check if this trip has stops at our target station
+                for stop_update in trip_update.stop_time_update:
+                    stop_id = stop_update.stop_id
                     
-                    # Check if this trip has stops at our target station
-                    for stop_update in trip_update.stop_time_update:
-                        stop_id = stop_update.stop_id
-                        
-                        # Check if this route serves this station
-                        # Atlantic Ave has multiple station IDs: A42, A42S, A42N, R30, R30S, R30N
-                        station_served = False
-                        for station_id, serving_routes in target_stations.items():
-                            if station_id in stop_id and route_id in serving_routes:
-                                station_served = True
-                                break
-                        
-                        if station_served:
-                            if stop_update.HasField('arrival'):
-                                arrival_time = datetime.fromtimestamp(stop_update.arrival.time)
-                                
-                                # Only show arrivals in the next 30 minutes
-                                if arrival_time > current_time and (arrival_time - current_time).total_seconds() < 1800:
-                                    # Get trip details
-                                    trip = trip_update.trip
-                                    # Handle different field names for trip headsign
-                                    headsign = getattr(trip, 'trip_headsign', None) or getattr(trip, 'headsign', None)
-                                    
-                                    # Note: MTA real-time feeds don't include trip_headsign
-                                    # We'll use fallback destinations based on route
-                                    
-                                    destination = self._get_destination_name(headsign, route_id)
-                                    
-                                    arrivals.append({
-                                        'route_id': route_id,
-                                        'station_id': stop_id,
-                                        'arrival_time': arrival_time,
-                                        'destination': destination,
-                                        'detail': self._get_route_detail(route_id),
-                                        'status': 'On Time'
-                                    })
-            
-            # Sort by arrival time and limit to 4 per feed
-            arrivals.sort(key=lambda x: x['arrival_time'])
-            return arrivals[:4]
+                    # Check if this route serves this station
+                    serving_routes = stop_route_map.get(stop_id)
+                    if serving_routes and route_id in serving_routes:
+                        arrival_ts = stop_update.arrival.time
+                        if arrival_ts:  # 0 = no arrival
+                            add((arrival_ts, route_id, stop_id))
+            return candidates
             
         except Exception as e:
             logger.error(f"Error parsing protobuf data: {e}")
-            return []
+            return None
     
+    def _select_arrivals(self, candidates: list) -> List[Arrival]:
+        """Build the soonest 4 arrivals in the next 30 minutes from candidate tuples"""
+        # Compare raw integer feed timestamps
+        now_ts = time.time()
+        horizon_ts = now_ts + 1800
+        upcoming = [c for c in candidates if now_ts < c[0] < horizon_ts]
+        
+        # MTA real-time feeds don't include a trip headsign, so destinations
+        # come from the route fallbacks.
+        # Feed times are Unix seconds; shift them onto the monotonic clock.
+        to_monotonic = time.monotonic() - now_ts
+        return [
+            Arrival(route_id, stop_id, arrival_ts + to_monotonic,
+                    self._get_destination_name(route_id),
+                    self._get_route_detail(route_id))
+            for arrival_ts, route_id, stop_id in heapq.nsmallest(4, upcoming, key=lambda c: c[0])
+        ]
     
-    def _get_destination_name(self, headsign: str, route_id: str = None) -> str:
-        """Clean up destination names from MTA data"""
-        if not headsign or headsign == "Unknown":
-            # Provide fallback destinations based on route
-            fallback_destinations = {
-                '1': '242 St', '2': 'Flatbush Av', '3': 'Jamaica Center', '4': 'Woodlawn', 
-                '5': '242 St', '6': 'Pelham Bay Park', '7': 'Flushing-Main St',
-                'A': 'Inwood-207 St', 'C': 'Euclid Av', 'E': 'Jamaica Center',
-                'B': 'Brighton Beach', 'D': 'Coney Island', 'F': 'Jamaica-179 St', 'M': 'Middle Village',
-                'G': 'Church Av', 'J': 'Jamaica Center', 'Z': 'Jamaica Center', 'L': 'Canarsie-Rockaway Pkwy',
-                'N': 'Coney Island', 'Q': 'Coney Island', 'R': 'Bay Ridge-95 St', 'W': 'Astoria-Ditmars Blvd',
-                'S': 'Times Sq-42 St'
-            }
-            return fallback_destinations.get(route_id, "Unknown")
-        
-        # Remove common prefixes and clean up
-        headsign = headsign.replace("To ", "").replace("TO ", "")
-        return headsign.strip()
+    def _get_destination_name(self, route_id: str) -> str:
+        """Destination shown for a route - the feeds carry no trip headsign"""
+        return FALLBACK_DESTINATIONS.get(route_id, "Unknown")
     
     def _get_route_detail(self, route_id: str) -> str:
         """Get route detail based on route ID"""
-        details = {
-            '1': '242 St', '2': 'Flatbush Av', '3': 'Jamaica Center', '4': 'Woodlawn', '5': '242 St', '6': 'Pelham Bay Park',
-            'A': 'Inwood-207 St', 'C': 'Euclid Av', 'E': 'Jamaica Center',
-            'B': 'Brighton Beach', 'D': 'Coney Island', 'F': 'Jamaica-179 St', 'M': 'Middle Village',
-            'G': 'Church Av', 'J': 'Jamaica Center', 'Z': 'Jamaica Center', 'L': 'Canarsie-Rockaway Pkwy',
-            'N': 'Coney Island', 'Q': 'Coney Island', 'R': 'Bay Ridge-95 St', 'W': 'Astoria-Ditmars Blvd',
-            'S': 'Times Sq-42 St'
-        }
-        return details.get(route_id, 'Unknown')
+        return ROUTE_DETAILS.get(route_id, 'Unknown')
     
-    def filter_nearby_stations(self, arrivals: List[Dict]) -> List[Dict]:
+    def filter_nearby_stations(self, arrivals: List[Arrival]) -> List[Arrival]:
         """Filter arrivals to show only nearby stations"""
-        # For now, return all arrivals since we're using realistic mock data
-        # In a real implementation, you'd filter by distance from your location
-        return arrivals[:4]  # Show max 4 arrivals like real MTA displays
+        # Stations are already selected by STATION_ID in _parse_candidates, and
+        # GTFS-realtime stop updates carry no coordinates, so there is nothing
+        # to measure a distance against here. If distance filtering is added,
+        # do it against a static stops table with one vectorized haversine pass
+        # rather than per-arrival geodesic() calls.
+        # Soonest 4 across all feeds - show max 4 arrivals like real MTA displays
+        return heapq.nsmallest(4, arrivals, key=lambda arrival: arrival.arrival_time)
     
-    def format_time_remaining(self, arrival_time: datetime) -> str:
-        """Format time remaining until arrival"""
-        now = datetime.now()
-        delta = arrival_time - now
+    def format_time_remaining(self, arrival_time: float, now: float = None) -> str:
+        """Format time remaining until an arrival given in time.monotonic() seconds"""
+        if now is None:
+            now = time.monotonic()
+        remaining = arrival_time - now
         
-        if delta.total_seconds() < 0:
+        if remaining < 0:
             return "Now"
-        elif delta.total_seconds() < 60:
-            return f"{int(delta.total_seconds())}s"
-        else:
-            minutes = int(delta.total_seconds() / 60)
-            return f"{minutes}m"
+        delta = int(remaining)
+        if delta < 60:
+            return SECOND_LABELS[delta]
+        minutes = delta // 60
+        if minutes < 60:
+            return MINUTE_LABELS[minutes]
+        return f"{minutes}m"
     
-    def draw_route_circle(self, surface, x: int, y: int, route_id: str, radius: int = 30):
-        """Draw a route circle in MTA style"""
+    def _time_remaining_text(self, arrival: Arrival, now: float) -> str:
+        """Countdown text for an arrival, recomputed at most once a second"""
+        second = int(now)
+        cached = arrival._fmt
+        if cached is None or cached[0] != second:
+            cached = arrival._fmt = (second, self.format_time_remaining(arrival.arrival_time, now))
+        return cached[1]
+    
+    def _make_route_sprite(self, route_id: str, radius: int):
+        """Render a route circle with its letter onto a transparent surface
+        
+        The result is left in its own format so it survives display changes.
+        """
         color = self.get_route_color(route_id)
-        pygame.draw.circle(surface, color, (x, y), radius)
+        sprite = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        # Transparent pixels carry the route color so antialiased edges don't darken
+        sprite.fill((*color, 0))
+        pygame.gfxdraw.filled_circle(sprite, radius, radius, radius - 1, color)
+        pygame.gfxdraw.aacircle(sprite, radius, radius, radius - 1, color)
         
         # Draw route text in white
         text_surface = self.route_font.render(route_id, True, self.colors['text_white'])
-        text_rect = text_surface.get_rect(center=(x, y))
-        surface.blit(text_surface, text_rect)
+        text_rect = text_surface.get_rect(center=(radius, radius))
+        sprite.blit(text_surface, text_rect)
+        return sprite
     
-    def draw_arrival(self, surface, x: int, y: int, arrival: Dict, sequence_num: int):
-        """Draw a single arrival entry matching the real MTA display layout"""
-        route_id = arrival['route_id']
-        destination = arrival['destination']
-        time_remaining = self.format_time_remaining(arrival['arrival_time'])
+    def _route_sprite(self, route_id: str, radius: int):
+        """Get the baked circle sprite for a route"""
+        key = (route_id, radius)
+        sprite = self._route_sprites.get(key)
+        if sprite is None:
+            master = self._route_masters.get(key)
+            if master is None:
+                # Unknown route or radius - draw it once, falls back to text color
+                master = self._route_masters[key] = self._make_route_sprite(route_id, radius)
+            sprite = self._route_sprites[key] = master.convert_alpha()
+        return sprite
+    
+    def draw_arrival(self, surface, x: int, y: int, arrival: Arrival, sequence_num: int,
+                     time_remaining: str = None, blits: list = None) -> pygame.Rect:
+        """Draw a single arrival entry matching the real MTA display layout
+        
+        Text and sprites are queued onto ``blits`` as (surface, position) pairs
+        for the caller to draw in one Surface.blits() call. Without a list they
+        are drawn before returning.
+        """
+        flush = blits is None
+        if flush:
+            blits = []
+        # Bind hot lookups once - this runs for every changed row
+        add = blits.append
+        render = self._render
+        text_primary = self.colors['text_primary']
+        row_background = self.colors['row_background']
+        screen_w = self.screen.get_width()
+        
+        route_id = arrival.route_id
+        destination = arrival.destination
+        if time_remaining is None:
+            time_remaining = self._time_remaining_text(arrival, time.monotonic())
         
         # Draw very subtle background rectangle for each entry (with more vertical padding)
-        entry_rect = pygame.Rect(x + 10, y + 5, self.screen.get_width() - 80, 80)  # Increased height to 80
-        pygame.draw.rect(surface, (5, 15, 35), entry_rect)  # Very subtle background
+        entry_rect = pygame.Rect(x + 10, y + 5, screen_w - 80, 80)  # Increased height to 80
+        pygame.draw.rect(surface, row_background, entry_rect)
         # Remove the border for cleaner look
         
         # Draw sequence number (left side)
-        seq_surface = self.sequence_font.render(str(sequence_num), True, self.colors['text_primary'])
-        surface.blit(seq_surface, (x + 20, y + 20))  # Shifted down by 5 pixels
+        add((render(self.sequence_font, str(sequence_num), text_primary, row_background), (x + 20, y + 20)))  # Shifted down by 5 pixels
         
         # Draw route circle (centered within the taller entry box)
         # New entry box is from y+5 to y+85, so center is at y+45
-        self.draw_route_circle(surface, x + 80, y + 45, route_id, radius=25)
+        add((self._route_sprite(route_id, 25), (x + 80 - 25, y + 45 - 25)))
         
         # Draw main destination (larger, bold text)
-        dest_surface = self.destination_font.render(destination, True, self.colors['text_primary'])
-        surface.blit(dest_surface, (x + 130, y + 15))  # Shifted down by 5 pixels
+        add((render(self.destination_font, destination, text_primary, row_background), (x + 130, y + 15)))  # Shifted down by 5 pixels
         
         # Draw secondary details (smaller text below destination with more spacing)
-        detail_text = arrival.get('detail', '')
+        detail_text = arrival.detail
         if detail_text:
-            detail_surface = self.detail_font.render(detail_text, True, self.colors['text_secondary'])
-            surface.blit(detail_surface, (x + 130, y + 50))  # Shifted down by 5 pixels
+            detail_surface = render(self.detail_font, detail_text, self.colors['text_secondary'], row_background)
+            add((detail_surface, (x + 130, y + 50)))  # Shifted down by 5 pixels
+        
+        # Draw arrival time (right side)
+        self.draw_arrival_time(y, time_remaining, blits)
+        
+        if flush:
+            surface.blits(blits, doreturn=False)
         
-        # Draw arrival time (right side) - matching the real display format
+        # Everything above is drawn inside the entry box
+        return entry_rect
+    
+    def draw_arrival_time(self, y: int, time_remaining: str, blits: list) -> pygame.Rect:
+        """Queue the right-aligned countdown for the row at ``y``
+        
+        Returns the fixed time column, which covers any countdown text.
+        """
+        # Matching the real display format
         if time_remaining == "Now":
             time_num = "Now"
             time_unit = ""
@@ -344,70 +642,95 @@ class MTADisplay:
             time_num = time_remaining.replace('m', '')
             time_unit = "MM"
         
-        # Right-align the time text
-        time_surface = self.time_font.render(time_num, True, self.colors['text_primary'])
-        time_rect = time_surface.get_rect()
-        time_x = self.screen.get_width() - 50 - time_rect.width  # Right-align with 50px margin
-        surface.blit(time_surface, (time_x, y + 20))  # Shifted down by 5 pixels
+        # Right-align the time text with a 50px margin
+        right = self.screen.get_width() - 50
+        row_background = self.colors['row_background']
+        time_surface = self._render(self.time_font, time_num, self.colors['text_primary'], row_background)
+        blits.append((time_surface, (right - time_surface.get_width(), y + 20)))  # Shifted down by 5 pixels
         
         if time_unit:
-            unit_surface = self.time_unit_font.render(time_unit, True, self.colors['text_primary'])
-            unit_rect = unit_surface.get_rect()
-            unit_x = self.screen.get_width() - 50 - unit_rect.width  # Right-align with 50px margin
-            surface.blit(unit_surface, (unit_x, y + 45))  # Shifted down by 5 pixels
+            unit_surface = self._render(self.time_unit_font, time_unit, self.colors['text_primary'], row_background)
+            blits.append((unit_surface, (right - unit_surface.get_width(), y + 45)))  # Shifted down by 5 pixels
+        
+        return pygame.Rect(right - self._time_column_w, y + 5, self._time_column_w, 80)
     
-    def draw_display(self, arrivals: List[Dict]):
-        """Draw the main display matching the real MTA sign layout"""
-        # Fill with dark blue background
-        self.screen.fill(self.colors['background'])
+    def draw_display(self, arrivals: List[Arrival]) -> bool:
+        """Draw the main display matching the real MTA sign layout
         
-        # Draw black frame around the display
-        frame_rect = pygame.Rect(10, 10, self.screen.get_width() - 20, self.screen.get_height() - 20)
-        pygame.draw.rect(self.screen, self.colors['frame'], frame_rect, 3)
+        Returns False when nothing visible changed and the frame was skipped.
+        """
+        # Rendered state of each row - identical state means identical pixels.
+        # The clock is read once and shared by every row.
+        now = time.monotonic()
+        rows = tuple(
+            (arrival.route_id, arrival.destination, arrival.detail,
+             self._time_remaining_text(arrival, now))
+            for arrival in arrivals[:4]  # Show max 4 arrivals like real display
+        )
+        if rows == self._last_rows:
+            return False
         
-        # Draw green status light at top center
-        status_light_rect = pygame.Rect(self.screen.get_width() // 2 - 5, 15, 10, 10)
-        pygame.draw.rect(self.screen, self.colors['status_light'], status_light_rect)
+        screen = self.screen
+        width, height = screen.get_size()
+        draw_arrival = self.draw_arrival
         
-        # Draw sign ID in top left (like "468-0-4" in the image)
-        sign_id = "MTA-001"
-        id_surface = self.detail_font.render(sign_id, True, self.colors['text_white'])
-        self.screen.blit(id_surface, (20, 20))
+        # Draw arrivals in horizontal rows like the real display
+        y_start = 80
+        y_spacing = 90  # Increased space between rows for better readability
         
-        # Draw station name below the sign ID
-        station_surface = self.destination_font.render(self.station_name, True, self.colors['text_white'])
-        self.screen.blit(station_surface, (20, 45))
+        # Same number of rows as last frame: redraw and update only the rows that changed
+        if self._last_rows and len(rows) == len(self._last_rows):
+            dirty = []
+            blits = []
+            for i, (row, last_row) in enumerate(zip(rows, self._last_rows)):
+                if row == last_row:
+                    continue
+                y_pos = y_start + (i * y_spacing)
+                if row[:3] == last_row[:3]:
+                    # Only the countdown moved - repaint just the time column
+                    time_rect = self.draw_arrival_time(y_pos, row[3], blits)
+                    pygame.draw.rect(screen, self.colors['row_background'], time_rect)
+                    dirty.append(time_rect)
+                else:
+                    dirty.append(draw_arrival(screen, 30, y_pos, arrivals[i], i + 1, row[3], blits))
+            screen.blits(blits, doreturn=False)
+            self._last_rows = rows
+            # Once the changed rows cover a quarter of the screen, one full
+            # present is cheaper than pushing the rects separately
+            if sum(rect.w * rect.h for rect in dirty) * 4 >= width * height:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
+            return True
+        
+        self._last_rows = rows
         
         # Check if we have any arrivals
         if not arrivals:
-            # Draw error message
-            error_surface = self.destination_font.render("NO DATA AVAILABLE", True, self.colors['text_white'])
-            error_rect = error_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
-            self.screen.blit(error_surface, error_rect)
-            
-            # Draw additional error info
-            error_detail = self.detail_font.render("Check MTA API connection", True, self.colors['text_secondary'])
-            detail_rect = error_detail.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2 + 40))
-            self.screen.blit(error_detail, detail_rect)
+            # Pre-rendered chrome plus error message
+            screen.blit(self._no_data_background, (0, 0))
             pygame.display.flip()
-            return
+            return True
         
-        # Draw arrivals in horizontal rows like the real display
-        y_start = 80
-        y_spacing = 90  # Increased space between rows for better readability
+        # Static chrome: background, frame, status light, sign ID, station name
+        screen.blit(self._background, (0, 0))
+        blits = []
         
-        for i, arrival in enumerate(arrivals[:4]):  # Show max 4 arrivals like real display
+        for i, arrival in enumerate(arrivals[:4]):
             y_pos = y_start + (i * y_spacing)
-            self.draw_arrival(self.screen, 30, y_pos, arrival, i + 1)
+            draw_arrival(screen, 30, y_pos, arrival, i + 1, rows[i][3], blits)
             
             # Draw subtle divider line between entries (except after the last one)
-            if i < len(arrivals[:4]) - 1:
+            if i < len(rows) - 1:
                 divider_y = y_pos + 88  # Position the divider below the current entry (y_pos + 5 + 80 + 3 = y_pos + 88)
                 # Use a more subtle color and thinner line
-                pygame.draw.line(self.screen, (50, 80, 120), 
-                               (60, divider_y), (self.screen.get_width() - 60, divider_y), 1)
+                pygame.draw.line(screen, (50, 80, 120), 
+                               (60, divider_y), (width - 60, divider_y), 1)
         
+        # All text and sprites in one pass, after the boxes and dividers beneath them
+        screen.blits(blits, doreturn=False)
         pygame.display.flip()
+        return True
     
     def handle_events(self):
         """Handle pygame events"""
@@ -421,6 +744,41 @@ class MTADisplay:
                     # Toggle fullscreen
                     self.fullscreen = not self.fullscreen
                     self.setup_display()
+            elif event.type in (pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+                                pygame.WINDOWRESTORED, pygame.VIDEOEXPOSE):
+                # Window contents may have been lost - force a full redraw
+                self._last_rows = None
+    
+    def _should_refresh(self, arrivals: List[Arrival], last_fetch: float) -> bool:
+        """Whether new data could change what the display shows"""
+        now = time.monotonic()
+        if not arrivals or now - last_fetch >= self.max_data_age:
+            return True
+        # Nothing is due soon - the countdowns on screen are still accurate
+        return min(arrival.arrival_time for arrival in arrivals) - now < self.refresh_lead_time
+    
+    def _refresh_loop(self):
+        """Background thread: fetch fresh arrivals every refresh interval"""
+        arrivals = []
+        last_fetch = 0.0
+        while not self._stop.is_set():
+            if self._should_refresh(arrivals, last_fetch):
+                logger.debug("Updating MTA data...")
+                try:
+                    arrivals = self.fetch_mta_data()
+                    arrivals = self.filter_nearby_stations(arrivals)
+                except Exception as e:
+                    logger.error(f"Error updating MTA data: {e}")
+                else:
+                    last_fetch = time.monotonic()
+                    # Keep only the newest result for the render loop
+                    try:
+                        self._arrivals_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    self._arrivals_q.put(arrivals)
+            
+            self._stop.wait(self.refresh_interval)
     
     def run(self):
         """Main application loop"""
@@ -428,33 +786,32 @@ class MTADisplay:
         logger.info(f"Station: {self.station_name} ({', '.join(self.station_ids)})")
         logger.info(f"Location: {self.latitude}, {self.longitude}")
         logger.info(f"Refresh interval: {self.refresh_interval} seconds")
-        last_update = 0
+        
+        # Network refresh runs off the render loop so slow feeds never stall it
+        refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+        refresh_thread.start()
         
         while self.running:
-            current_time = time.time()
-            
-            # Update data at specified intervals
-            if current_time - last_update >= self.refresh_interval:
-                logger.info("Updating MTA data...")
-                arrivals = self.fetch_mta_data()
-                arrivals = self.filter_nearby_stations(arrivals)
-                last_update = current_time
-            else:
-                # Use cached data
-                arrivals = getattr(self, 'cached_arrivals', [])
-            
-            # Cache arrivals for next frame
-            self.cached_arrivals = arrivals
+            # Pick up new data if the refresh thread has delivered some
+            try:
+                self.cached_arrivals = self._arrivals_q.get_nowait()
+            except queue.Empty:
+                pass
             
             # Draw display
-            self.draw_display(arrivals)
+            changed = self.draw_display(self.cached_arrivals)
             
             # Handle events
             self.handle_events()
             
-            # Control frame rate
-            self.clock.tick(60)
+            # Control frame rate - content changes at most once a second,
+            # so drop further while frames are being skipped
+            self.clock.tick(self._active_fps if changed else self._idle_fps)
         
+        # Stop the refresh thread and drop any feed fetches still queued;
+        # a fetch already in flight is abandoned with the daemon thread
+        self._stop.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
         logger.info("MTA Display stopped.")
 
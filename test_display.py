@@ -6,68 +6,52 @@ Run this to test the display without needing real MTA API data
 
 import os
 import sys
-import pygame
-from datetime import datetime, timedelta
+import time
 
-# Add the current directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the current directory to Python path (already there when run as a script)
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
-from mta_display import MTADisplay
+from mta_display import MTADisplay, Arrival
+
+# Mock arrivals: (route_id, destination, detail, status, minutes away).
+# Sorted once here so fetch_mta_data hands back soonest-first, like the real feed path.
+_MOCK_TEMPLATE = tuple(sorted((
+    ('2', 'Flatbush Av', 'Brooklyn', 'On Time', 1),
+    ('3', 'Jamaica Center', 'Queens', 'On Time', 2),
+    ('4', 'Woodlawn', 'Bronx', 'On Time', 3),
+    ('5', 'Uptown', '242 St', 'On Time', 4),
+), key=lambda entry: entry[4]))
+
+# Settings for test mode - no API key needed, MTA feeds are free.
+# Applied with setdefault so values already in the environment win.
+_TEST_ENV = {
+    'LATITUDE': '40.7589',
+    'LONGITUDE': '-73.9851',
+    'STATION_NAME': 'Atlantic Av-Barclays Ctr',
+    'FULLSCREEN': 'false',
+    'REFRESH_INTERVAL': '5',
+}
+
+def _configure_env():
+    """Fill in the test settings that aren't already set"""
+    for key, value in _TEST_ENV.items():
+        os.environ.setdefault(key, value)
 
 class TestMTADisplay(MTADisplay):
     """Test version of MTA Display with mock data"""
     
-    def __init__(self):
-        # Set up test environment variables
-        # No API key needed - MTA feeds are now free!
-        os.environ['LATITUDE'] = '40.7589'
-        os.environ['LONGITUDE'] = '-73.9851'
-        os.environ['STATION_NAME'] = 'Atlantic Av-Barclays Ctr'
-        os.environ['FULLSCREEN'] = 'false'
-        os.environ['REFRESH_INTERVAL'] = '5'
-        
-        super().__init__()
-    
     def fetch_mta_data(self):
         """Return mock MTA data for testing"""
-        current_time = datetime.now()
+        current_time = time.monotonic()
         
-        mock_arrivals = [
-            {
-                'route_id': '2',
-                'station_id': 'test_station',
-                'arrival_time': current_time + timedelta(minutes=1),
-                'destination': 'Flatbush Av',
-                'detail': 'Brooklyn',
-                'status': 'On Time'
-            },
-            {
-                'route_id': '3',
-                'station_id': 'test_station',
-                'arrival_time': current_time + timedelta(minutes=2),
-                'destination': 'Jamaica Center',
-                'detail': 'Queens',
-                'status': 'On Time'
-            },
-            {
-                'route_id': '4',
-                'station_id': 'test_station',
-                'arrival_time': current_time + timedelta(minutes=3),
-                'destination': 'Woodlawn',
-                'detail': 'Bronx',
-                'status': 'On Time'
-            },
-            {
-                'route_id': '5',
-                'station_id': 'test_station',
-                'arrival_time': current_time + timedelta(minutes=4),
-                'destination': 'Uptown',
-                'detail': '242 St',
-                'status': 'On Time'
-            }
+        # Fresh objects every refresh: this runs on the refresh thread, and
+        # the arrivals already on screen belong to the render loop
+        return [
+            Arrival(route_id, 'test_station', current_time + minutes * 60, destination, detail, status)
+            for route_id, destination, detail, status, minutes in _MOCK_TEMPLATE
         ]
-        
-        return mock_arrivals
 
 def main():
     """Run the test display"""
@@ -76,6 +60,7 @@ def main():
     print("Press ESC to exit, F11 to toggle fullscreen")
     
     try:
+        _configure_env()
         app = TestMTADisplay()
         app.run()
     except KeyboardInterrupt: